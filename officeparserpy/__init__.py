@@ -2,6 +2,7 @@
 
 from .officeparserpy import (
     parse_office,
+    parse_office_batch,
     OfficeParserConfig,
     ExtensionUnsupported,
     FileCorrupted,
@@ -13,6 +14,7 @@ from .officeparserpy import (
 
 __all__ = [
     'parse_office',
+    'parse_office_batch',
     'OfficeParserConfig',
     'ExtensionUnsupported',
     'FileCorrupted',
@@ -6,52 +6,317 @@ Currently supports docx, pptx, xlsx, odt, odp, ods, pdf files.
 """
 
 # Standard imports
-from xml.dom.minidom import parseString
-from typing import Dict, List, Union, Literal
-from io import BytesIO
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union, Literal
+from io import BytesIO, StringIO
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 import re
 import os
+import itertools
 import sys
 import shutil
 import zipfile
 import time
+import importlib.util
+import hashlib
+import struct
+import threading
 # External imports
-from pdfminer.high_level import extract_text as extract_text_from_pdf
-import filetype
+# pdfminer.six and filetype take a while to import and are only needed for PDF files and unusual buffers,
+# so they are imported in the functions that use them.
+from lxml import etree
+
+
+
+##################################################### XML Utils #####################################################
+# Namespaces of the xml tags that hold text in office files. lxml addresses tags as {namespace}localname.
+NS_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+NS_A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+NS_SS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_C = 'http://schemas.openxmlformats.org/drawingml/2006/chart'
+# Strict Open XML files use their own namespaces for the same tags, so the tags are looked up in both of them.
+NS_W_STRICT = 'http://purl.oclc.org/ooxml/wordprocessingml/main'
+NS_A_STRICT = 'http://purl.oclc.org/ooxml/drawingml/main'
+NS_SS_STRICT = 'http://purl.oclc.org/ooxml/spreadsheetml/main'
+NS_C_STRICT = 'http://purl.oclc.org/ooxml/drawingml/chart'
+NS_TEXT = 'urn:oasis:names:tc:opendocument:xmlns:text:1.0'
+NS_PRESENTATION = 'urn:oasis:names:tc:opendocument:xmlns:presentation:1.0'
+
+def get_qualified_tags(local_name: str, *namespaces: str) -> Tuple[str, ...]:
+    """
+    Get the tags with a local name in each of the given namespaces, qualified the way lxml addresses them.
+
+    Args:
+        local_name (str): Local name of the tag.
+        *namespaces (str): Namespaces of the tag.
+
+    Returns:
+        Tuple[str, ...]: The namespace qualified tags.
+    """
+    return tuple(f"{{{namespace}}}{local_name}" for namespace in namespaces)
+
+# Tags of the Office Open XML files in both their Transitional and Strict namespaces
+_W_P_TAGS = get_qualified_tags('p', NS_W, NS_W_STRICT)
+_W_T_TAGS = get_qualified_tags('t', NS_W, NS_W_STRICT)
+_A_P_TAGS = get_qualified_tags('p', NS_A, NS_A_STRICT)
+_A_T_TAGS = get_qualified_tags('t', NS_A, NS_A_STRICT)
+_SS_SI_TAGS = get_qualified_tags('si', NS_SS, NS_SS_STRICT)
+_SS_T_TAGS = get_qualified_tags('t', NS_SS, NS_SS_STRICT)
+_SS_RPH_TAGS = get_qualified_tags('rPh', NS_SS, NS_SS_STRICT)
+_SS_C_TAGS = get_qualified_tags('c', NS_SS, NS_SS_STRICT)
+_SS_V_TAGS = get_qualified_tags('v', NS_SS, NS_SS_STRICT)
+_C_V_TAGS = get_qualified_tags('v', NS_C, NS_C_STRICT)
+
+# Compiled XPath queries returning the text of every w:t / a:t node under a paragraph. libxml2 collects the strings
+# in a single C traversal, so joining them does not cost a Python level attribute lookup per text node.
+# Only the text of the text nodes is selected which keeps field codes, deleted text and tails out of the result.
+# A paragraph only uses one of the namespaces, so the union of both still returns its text in document order.
+_W_TEXT_XPATH = etree.XPath('.//w:t/text() | .//ws:t/text()', namespaces={'w': NS_W, 'ws': NS_W_STRICT}, smart_strings=False)
+_A_TEXT_XPATH = etree.XPath('.//a:t/text() | .//as:t/text()', namespaces={'a': NS_A, 'as': NS_A_STRICT}, smart_strings=False)
+
+def has_descendant(element: etree._Element, tags: Tuple[str, ...]) -> bool:
+    """
+    Check if an element has a descendant with any of the given tags.
+
+    Args:
+        element (etree._Element): The element to look in.
+        tags (Tuple[str, ...]): Namespace qualified tags to look for.
+
+    Returns:
+        bool: True if a descendant with one of the tags exists, False otherwise.
+    """
+    return next(element.iterdescendants(*tags), None) is not None
+
+# Options of the xml parsers that keep external entities, like local files or urls, out of the parsed text.
+# lxml resolves them by default before version 6.1, which would let an untrusted office file read files on this machine.
+_XML_PARSER_OPTIONS = {'resolve_entities': False, 'no_network': True}
+
+def iter_xml_elements(source, *tags: str) -> Iterator[etree._Element]:
+    """
+    Stream the elements with the given tags out of an xml file in document order.
+
+    Each outermost matching element is yielded as soon as it has been parsed completely, followed by the matching
+    elements nested inside it. It is then cleared along with its already consumed siblings, so the memory held
+    stays proportional to a single element instead of the whole document.
+
+    Args:
+        source: Path or binary file object of the xml file.
+        *tags (str): Namespace qualified tags of the elements to stream.
+
+    Yields:
+        etree._Element: The matching elements.
+
+    Raises:
+        etree.XMLSyntaxError: If the xml content is not well-formed.
+    """
+    depth = 0
+    for event, element in etree.iterparse(source, events=('start', 'end'), tag=tags, **_XML_PARSER_OPTIONS):
+        if event == 'start':
+            depth += 1
+            continue
+
+        depth -= 1
+        # Nested elements are yielded along with their outermost matching ancestor.
+        if depth:
+            continue
+
+        yield from element.iter(*tags)
+
+        # Free the element and the references its parent holds to the siblings that were consumed before it.
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+# Upper limit of threads used to parse the xml files of a single office file
+MAX_XML_PARSING_THREADS = 8
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+def map_in_threads(function: Callable[[T], R], items: List[T]) -> List[R]:
+    """
+    Apply a function to every item on a thread pool while keeping the order of the items.
+    lxml releases the GIL while libxml2 parses, so independent xml files can be parsed alongside each other.
+
+    Args:
+        function (Callable): Function to apply to each item.
+        items (List): Items to apply the function to.
 
+    Returns:
+        List: Results of the function in the order of the items.
+    """
+    # A pool is not worth starting for a single item
+    if len(items) < 2:
+        return [function(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_XML_PARSING_THREADS, len(items))) as executor:
+        return list(executor.map(function, items))
+
+def join_text_groups(delimiter: str, text_groups: List[List[str]]) -> str:
+    """
+    Join the texts of all the groups with a delimiter in a single pass.
+    The result is the same as joining the texts of each group first and then joining those, so a group without any
+    text still takes its place as an empty text.
 
+    Args:
+        delimiter (str): Delimiter put between the texts.
+        text_groups (List[List[str]]): Groups of texts, like the texts of each xml file.
 
+    Returns:
+        str: The joined text.
+    """
+    return delimiter.join([text for texts in text_groups for text in (texts or ('',))])
+#####################################################################################################################
 ################################################### Zip Extractor ###################################################
-def extract_files_with_regex(zip_path: str, extract_path: str, regex_pattern: str) -> List[str]:
+# Size of the buffers used to read ZIP archives and write their extracted files
+ZIP_BUFFER_SIZE = 1 << 20
+
+# Number of ZIP archives whose decompressed files are kept in memory when caching is requested in the config
+ZIP_MEMBERS_CACHE_SIZE = 32
+
+# Decompressed files of the recently parsed ZIP archives keyed by the digest of the archive, least recently used first
+_zip_members_cache: 'OrderedDict[bytes, Dict[str, bytes]]' = OrderedDict()
+_zip_members_cache_lock = threading.Lock()
+
+def get_cached_zip_members(digest: bytes) -> Dict[str, bytes]:
     """
-    Extract files from a ZIP archive based on a regex pattern.
+    Get the cached decompressed files of a ZIP archive, making room for it in the cache if it is not there yet.
 
     Args:
-        zip_path (str): Path to the ZIP archive.
-        extract_path (str): Directory where the files will be extracted.
-        regex_pattern (str): Regular expression pattern to match filenames.
+        digest (bytes): Digest of the content of the ZIP archive.
 
     Returns:
-        List[str]: List of file names that were extracted.
+        Dict[str, bytes]: Content of the decompressed files keyed by their names. New files can be added to it.
+    """
+    with _zip_members_cache_lock:
+        members = _zip_members_cache.get(digest)
+        if members is None:
+            members = _zip_members_cache[digest] = {}
+            # Drop the least recently used archives
+            while len(_zip_members_cache) > ZIP_MEMBERS_CACHE_SIZE:
+                _zip_members_cache.popitem(last=False)
+        else:
+            _zip_members_cache.move_to_end(digest)
+        return members
+
+class CachedZipFile(zipfile.ZipFile):
+    """
+    ZIP archive that keeps the content of the files read from it in a cache, so the same archive does not have to be
+    decompressed again for every parse.
+
+    Attributes:
+        members -- Content of the decompressed files keyed by their names. Shared by all the opened copies of the archive.
+    """
+    def __init__(self, file: BinaryIO, members: Dict[str, bytes]):
+        super().__init__(file, 'r')
+        self.members = members
+
+    def open(self, name, mode='r', pwd=None, **kwargs):
+        if mode != 'r':
+            return super().open(name, mode, pwd, **kwargs)
+        file_name = name.filename if isinstance(name, zipfile.ZipInfo) else name
+        content = self.members.get(file_name)
+        if content is None:
+            with super().open(name, mode, pwd) as member:
+                content = self.members[file_name] = member.read()
+        return BytesIO(content)
+
+def get_file_digest(file: BinaryIO) -> bytes:
+    """
+    Hash the content of a file in chunks, leaving the file at its start afterwards.
+
+    Args:
+        file (BinaryIO): The file opened in binary mode.
+
+    Returns:
+        bytes: The blake2b digest of the content of the file.
+    """
+    file_hash = hashlib.blake2b()
+    for chunk in iter(lambda: file.read(ZIP_BUFFER_SIZE), b''):
+        file_hash.update(chunk)
+    file.seek(0)
+    return file_hash.digest()
+
+@contextmanager
+def open_zip_file(zip_path: Union[str, BinaryIO], cache_members: bool = False) -> Iterator[zipfile.ZipFile]:
+    """
+    Open a ZIP archive for reading its files as streams.
+    An archive on disk is read through a large buffer to make fewer system calls while scanning and reading its entries.
+
+    Args:
+        zip_path (Union[str, BinaryIO]): Path to the ZIP archive or the archive opened in binary mode.
+        cache_members (bool, optional): Keep the decompressed files in memory for the next time the same archive is opened.
+
+    Yields:
+        zipfile.ZipFile: The opened ZIP archive.
 
     Raises:
-        zipfile.BadZipFile: If the specified file (`zip_path`) is not a valid ZIP archive.
+        FileCorrupted: If the specified file (`zip_path`) cannot be opened as a ZIP archive.
     """
-    extracted_files = []
-    
+    # Archives opened by the caller are left open for the caller to close
+    is_path = isinstance(zip_path, str)
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            matching_files = [file for file in zip_ref.namelist() if re.search(regex_pattern, file)]
+        zip_file = open(zip_path, 'rb', buffering=ZIP_BUFFER_SIZE) if is_path else zip_path
+        try:
+            if cache_members:
+                zip_ref = CachedZipFile(zip_file, get_cached_zip_members(get_file_digest(zip_file)))
+            else:
+                zip_ref = zipfile.ZipFile(zip_file, 'r')
+        except Exception:
+            if is_path:
+                zip_file.close()
+            raise
+    except Exception as e:
+        raise FileCorrupted(get_file_name_for_errors(zip_path)) from e
 
-            for file in matching_files:
-                zip_ref.extract(file, extract_path)
-                extracted_files.append(file)
+    try:
+        with zip_ref:
+            yield zip_ref
+    finally:
+        if is_path:
+            zip_file.close()
 
-    except Exception as e:
-        raise FileCorrupted(zip_path) from e
+def extract_files_with_regex(zip_ref: zipfile.ZipFile, regex_pattern: re.Pattern) -> Dict[str, List[str]]:
+    """
+    Find the files of a ZIP archive based on a regex pattern of named groups. Their content can then be streamed with `zip_ref.open`.
+    The pattern is matched once against every name of the archive and each matching file name is listed under the group
+    that it matched, keeping the order of the files in the archive within a group.
 
+    Args:
+        zip_ref (zipfile.ZipFile): The opened ZIP archive.
+        regex_pattern (re.Pattern): Compiled regular expression pattern to match filenames, with a named group for each
+                                    alternative and no other capturing groups.
+
+    Returns:
+        Dict[str, List[str]]: List of file names that matched, keyed by group name.
+    """
+    extracted_files: Dict[str, List[str]] = {group: [] for group in regex_pattern.groupindex}
+    match_file_name = regex_pattern.match
+    for file in zip_ref.namelist():
+        file_match = match_file_name(file)
+        if file_match:
+            extracted_files[file_match.lastgroup].append(file)
     return extracted_files
 
+def extract_files_to_disk(zip_ref: zipfile.ZipFile, extract_path: str, file_names: List[str]) -> None:
+    """
+    Extract files from a ZIP archive into a directory.
+
+    Args:
+        zip_ref (zipfile.ZipFile): The opened ZIP archive.
+        extract_path (str): Directory where the files will be extracted.
+        file_names (List[str]): Names of the files to extract.
+
+    Raises:
+        FileCorrupted: If the files cannot be extracted.
+    """
+    try:
+        # extractall keeps the files within extract_path the same way extract does
+        zip_ref.extractall(path=extract_path, members=file_names)
+    except Exception as e:
+        raise FileCorrupted(get_file_name_for_errors(zip_ref.filename or zip_ref.fp)) from e
+
 def display_extracted_files(extract_path: str) -> None:
     """
     Display the paths of the extracted files.
@@ -82,10 +347,14 @@ AllowedKeys = Literal[
     'newline_delimiter',
     'ignore_notes',
     'put_notes_at_last',
+    'pdf_backend',
+    'pdf_max_workers',
+    'cache_decompressed_files',
+    'pdf_fast_mode',
 ]
 
 # Define the type of the config variable
-OfficeParserConfig = Dict[AllowedKeys, Union[bool, str, None]]
+OfficeParserConfig = Dict[AllowedKeys, Union[bool, str, int, None]]
 
 __all__ = [
     'OfficeParserConfig',
@@ -95,6 +364,10 @@ __all__ = [
     'get_newline_delimiter',
     'get_ignore_notes',
     'get_put_notes_at_last',
+    'get_pdf_backend',
+    'get_pdf_max_workers',
+    'get_cache_decompressed_files',
+    'get_pdf_fast_mode',
 ]
 
 default_temp_files_location = 'officeparser_temp'
@@ -128,9 +401,30 @@ def get_put_notes_at_last(config: OfficeParserConfig) -> bool:
     """Get the 'put_notes_at_last' property with a default value."""
     return config.get('put_notes_at_last', False)
 
+
+def get_pdf_backend(config: OfficeParserConfig) -> str:
+    """Get the 'pdf_backend' property with a default value."""
+    return config.get('pdf_backend', 'pdfminer')
+
+
+def get_pdf_max_workers(config: OfficeParserConfig) -> int:
+    """Get the 'pdf_max_workers' property with a default value."""
+    return config.get('pdf_max_workers', 1)
+
+
+def get_cache_decompressed_files(config: OfficeParserConfig) -> bool:
+    """Get the 'cache_decompressed_files' property with a default value."""
+    return config.get('cache_decompressed_files', False)
+
+
+def get_pdf_fast_mode(config: OfficeParserConfig) -> bool:
+    """Get the 'pdf_fast_mode' property with a default value."""
+    return config.get('pdf_fast_mode', False)
+
 #####################################################################################################################
 #################################################### File Utils #####################################################
-GLOBAL_FILE_NAME_ITERATOR = 0
+# Incrementing number used in the generated file names. Taking the next value of itertools.count is atomic under the GIL.
+FILE_NAME_ITERATOR = itertools.count()
 
 def get_new_file_name(temp_files_location: str, ext: str) -> str:
     """
@@ -144,14 +438,64 @@ def get_new_file_name(temp_files_location: str, ext: str) -> str:
     Returns:
         str: The generated file name.
     """
-    global GLOBAL_FILE_NAME_ITERATOR    # Declare that we are using the global variable
+    # Return the file name with the iterator part wrapping around after 5 digits
+    return os.path.join(temp_files_location, 'tempfiles', f"{int(time.time())}{next(FILE_NAME_ITERATOR) % 100000:05d}.{ext}")
 
-    # Get the iterator part of the file name
-    iterator_part = str(GLOBAL_FILE_NAME_ITERATOR).zfill(5)
-    GLOBAL_FILE_NAME_ITERATOR = (GLOBAL_FILE_NAME_ITERATOR + 1) % 100000
+def get_decompress_location(file: Union[str, BinaryIO], temp_files_location: str) -> str:
+    """
+    Get the directory where the content files of an office file are extracted to when they are preserved.
+    It is named after the file, while a file held in memory gets a newly generated name.
 
-    # Return the file name
-    return f"{temp_files_location}/tempfiles/{int(time.time())}{iterator_part}.{ext}"
+    Args:
+        file (Union[str, BinaryIO]): The path of the file or the file opened in binary mode.
+        temp_files_location (str): Directory where the temp files are stored.
+
+    Returns:
+        str: The decompress location.
+    """
+    if isinstance(file, str):
+        return os.path.join(temp_files_location, os.path.basename(file))
+    return os.path.join(temp_files_location, os.path.basename(get_new_file_name(temp_files_location, 'zip')))
+
+def make_temp_files_directory(temp_files_location: str) -> None:
+    """
+    Create the directory that holds the temp files within a temp files location if it does not exist.
+    It is checked every time as the preserved temp files may have been deleted since the last call.
+
+    Args:
+        temp_files_location (str): Directory where the temp files are stored.
+    """
+    os.makedirs(os.path.join(temp_files_location, 'tempfiles'), exist_ok=True)
+
+def copy_file(source_path: str, destination_path: str) -> None:
+    """
+    Copy a file along with its metadata like shutil.copy2.
+    The content is copied by the kernel with os.copy_file_range where it is available, which lets filesystems that support it
+    share the blocks of the file instead of copying them. Otherwise, it falls back to shutil.copyfile.
+
+    Args:
+        source_path (str): Path of the file to copy.
+        destination_path (str): Path of the copy.
+    """
+    copied_in_kernel = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+                remaining = os.fstat(source.fileno()).st_size
+                # A single call may copy less than asked for
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), destination.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            copied_in_kernel = remaining == 0
+        # Older kernels and some filesystems do not support it
+        except OSError:
+            pass
+
+    if not copied_in_kernel:
+        shutil.copyfile(source_path, destination_path)
+    shutil.copystat(source_path, destination_path)
 
 def read_bytes_from_file(file_path):
     """
@@ -187,42 +531,147 @@ def read_bytes_from_file(file_path):
 
 
 
-def get_file_extension_from_bytes(file_content: bytes) -> str:
+@contextmanager
+def open_binary_file(file: Union[str, BinaryIO]) -> Iterator[BinaryIO]:
+    """
+    Open a file in binary mode, or pass a file object that is already open in binary mode through as it is.
+
+    Args:
+        file (Union[str, BinaryIO]): The path of the file or the file opened in binary mode.
+
+    Yields:
+        BinaryIO: The file opened in binary mode. It is only closed afterwards if it was opened here.
+    """
+    if isinstance(file, str):
+        with open(file, 'rb') as opened_file:
+            yield opened_file
+    else:
+        yield file
+
+def get_file_name_for_errors(file: Union[str, BinaryIO]) -> str:
+    """
+    Get the name of a file to show in error messages. Files held in memory do not have a path to show.
+
+    Args:
+        file (Union[str, BinaryIO]): The path of the file or the file opened in binary mode.
+
+    Returns:
+        str: The path of the file or a placeholder for in memory files.
+    """
+    return file if isinstance(file, str) else '<buffer>'
+
+# Number of leading bytes of a file that filetype looks at to identify its type
+FILE_SIGNATURE_LENGTH = 8192
+
+# Map of the mime types identified by filetype to the extensions of the supported files
+_MIME_TO_EXT = {
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': 'pptx',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
+    'application/pdf': 'pdf',
+    'application/vnd.oasis.opendocument.text': 'odt',
+    'application/vnd.oasis.opendocument.presentation': 'odp',
+    'application/vnd.oasis.opendocument.spreadsheet': 'ods',
+}
+
+# Folders holding the content of each kind of Office Open XML file, mapped to the extension of that kind of file
+_ZIP_FOLDER_TO_EXT = {
+    b'word/': 'docx',
+    b'ppt/': 'pptx',
+    b'xl/': 'xlsx',
+}
+# File in OpenOffice files that holds their mime type. It is always the first file of the archive and is not compressed.
+_OPEN_OFFICE_MIMETYPE_FILE_NAME = b'mimetype'
+# Signature and size of the fixed part of the local header in front of every file of a ZIP archive
+ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+ZIP_LOCAL_HEADER_LENGTH = 30
+
+def get_zip_file_extension(file_header: bytes) -> Optional[str]:
+    """
+    Identify the kind of an office file that is a ZIP archive from the names of the first files within it.
+    The local headers of the files are walked through in the leading bytes of the archive without reading the archive itself.
+
+    Args:
+        file_header (bytes): The leading bytes of the ZIP archive.
+
+    Returns:
+        str or None: The file extension corresponding to the files found in the leading bytes.
+                     Returns None if they do not show what kind of file it is.
+    """
+    offset = 0
+    while file_header.startswith(ZIP_LOCAL_HEADER_SIGNATURE, offset) and offset + ZIP_LOCAL_HEADER_LENGTH <= len(file_header):
+        flags, = struct.unpack_from('<H', file_header, offset + 6)
+        compressed_size, = struct.unpack_from('<I', file_header, offset + 18)
+        file_name_length, extra_field_length = struct.unpack_from('<HH', file_header, offset + 26)
+        file_name_start = offset + ZIP_LOCAL_HEADER_LENGTH
+        file_name = file_header[file_name_start:file_name_start + file_name_length]
+        data_start = file_name_start + file_name_length + extra_field_length
+
+        if file_name == _OPEN_OFFICE_MIMETYPE_FILE_NAME:
+            return _MIME_TO_EXT.get(file_header[data_start:data_start + compressed_size].decode('ascii', 'ignore'))
+        for folder, extension in _ZIP_FOLDER_TO_EXT.items():
+            if file_name.startswith(folder):
+                return extension
+
+        # The size of the file is only written after its data when this flag is set, so the next header cannot be found
+        if flags & 0x08:
+            break
+        offset = data_start + compressed_size
+    return None
+
+def get_file_extension_from_bytes(file_content: Union[bytes, str, BinaryIO]) -> str:
     """
     Identify the file type based on magic bytes and return the corresponding extension.
+    Only the leading bytes of the file are needed for this, so a file path or an open binary file can be passed
+    as well to avoid loading the whole document. An open file is put back at the position it was read from.
 
     Args:
-        file_content (bytes): The content of the file as bytes.
+        file_content (Union[bytes, str, BinaryIO]): The content of the file as bytes, the path of the file or the file opened in binary mode.
 
     Returns:
         str or None: The file extension corresponding to the identified file type.
                      Returns None if the type is not recognized.
     """
+    # Get the leading bytes of the file
+    if isinstance(file_content, str):
+        with open(file_content, 'rb') as file:
+            file_header = file.read(FILE_SIGNATURE_LENGTH)
+    elif isinstance(file_content, (bytes, bytearray)):
+        file_header = file_content[:FILE_SIGNATURE_LENGTH]
+    else:
+        # Read the leading bytes from where the file currently is, and seek back so the caller can still read it all
+        position = file_content.tell()
+        file_header = file_content.read(FILE_SIGNATURE_LENGTH)
+        file_content.seek(position)
+
+    # Fast path for the supported files, which are either PDF files or ZIP archives
+    if file_header.startswith(b'%PDF'):
+        return 'pdf'
+    if file_header.startswith(ZIP_LOCAL_HEADER_SIGNATURE):
+        zip_file_extension = get_zip_file_extension(file_header)
+        if zip_file_extension:
+            return zip_file_extension
+
     # Identify the file type based on magic bytes
-    file_info = filetype.guess(file_content)
-
-    # Map identified types to specific extensions
-    type_to_extension = {
-        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
-        'application/vnd.openxmlformats-officedocument.presentationml.presentation': 'pptx',
-        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
-        'application/pdf': 'pdf',
-        'application/vnd.oasis.opendocument.text': 'odt',
-        'application/vnd.oasis.opendocument.presentation': 'odp',
-        'application/vnd.oasis.opendocument.spreadsheet': 'ods',
-    }
-
-    # Check if the identified type is in the mapping
-    if file_info and file_info.mime in type_to_extension:
-        return type_to_extension[file_info.mime]
-
-    # If no match, return None
-    return None
+    import filetype
+    file_info = filetype.guess(file_header)
+
+    # Map the identified type to its extension. If there is no match, return None
+    return _MIME_TO_EXT.get(file_info.mime) if file_info else None
 #####################################################################################################################
 ################################################# Custom Exceptions #################################################
 ERROR_HEADER = '[officeparserpy]: '
 
-class FileCorrupted(Exception):
+class _OfficeParserException(Exception):
+    """
+    Base of the custom exceptions.
+    The args of an exception are the arguments it was constructed with, so the default pickling recreates it when it is
+    sent back from another process, while it is still shown with its customized error message.
+    """
+    def __str__(self):
+        return self.message
+
+class FileCorrupted(_OfficeParserException):
     """
     Exception raised for a corrupted file.
 
@@ -233,9 +682,9 @@ class FileCorrupted(Exception):
     def __init__(self, filepath):
         self.value = filepath
         self.message = f"Your file {filepath} seems to be corrupted. If you are sure it is fine, please create a ticket in Issues on github with the file to reproduce error."
-        super().__init__(self.message)
+        super().__init__(filepath)
 
-class ExtensionUnsupported(Exception):
+class ExtensionUnsupported(_OfficeParserException):
     """
     Exception raised for an unsupported file extension.
 
@@ -246,9 +695,9 @@ class ExtensionUnsupported(Exception):
     def __init__(self, ext):
         self.value = ext
         self.message = f"Sorry, officeparser currently supports docx, pptx, xlsx, odt, odp, ods, pdf files only. Create a ticket in Issues on github to add support for {ext} files. Stay tuned for further updates."
-        super().__init__(self.message)
+        super().__init__(ext)
 
-class FileDoesNotExist(Exception):
+class FileDoesNotExist(_OfficeParserException):
     """
     Exception raised for a non-existent file.
 
@@ -259,9 +708,9 @@ class FileDoesNotExist(Exception):
     def __init__(self, filepath):
         self.value = filepath
         self.message = f"File {filepath} could not be found! Check if the file exists or verify if the relative path to the file is correct from your terminal's location."
-        super().__init__(self.message)
+        super().__init__(filepath)
 
-class LocationNotFound(Exception):
+class LocationNotFound(_OfficeParserException):
     """
     Exception raised for an unreachable directory location.
 
@@ -272,28 +721,33 @@ class LocationNotFound(Exception):
     def __init__(self, location):
         self.value = location
         self.message = f"Entered location {location} is not reachable! Please make sure that the entered directory location exists. Check relative paths and reenter."
-        super().__init__(self.message)
+        super().__init__(location)
 
-class ImproperArguments(Exception):
+class ImproperArguments(_OfficeParserException):
     """Exception raised for improper function arguments."""
     def __init__(self):
         self.message = "Improper arguments"
-        super().__init__(self.message)
+        super().__init__()
 
-class ImproperBuffers(Exception):
+class ImproperBuffers(_OfficeParserException):
     """Exception raised for errors while reading file buffers."""
     def __init__(self):
         self.message = "Error occurred while reading the file buffers"
-        super().__init__(self.message)
+        super().__init__()
 #####################################################################################################################
 
-def _parse_word(filepath: str, config: OfficeParserConfig) -> str:
+# The target content xml files for the docx file
+_WORD_RE = re.compile(r"(?P<content>word\/(?:document[\d+]?|footnotes[\d+]?|endnotes[\d+]?)\.xml)")
+# Prefix of the document xml files among the content files
+_WORD_DOCUMENT_PREFIX = 'word/document'
+
+def _parse_word(filepath: Union[str, BinaryIO], config: OfficeParserConfig) -> str:
     """
     This function parses word files and returns the parsed text.
     It decides a few configurations of the parsing using the config object passed in the argument.
 
     Args:
-        filepath: The path of the docx file that needs to be parsed.
+        filepath: The path of the docx file that needs to be parsed or the file opened in binary mode.
         config: A config dictionary for parsing text from this file.
 
     Returns:
@@ -303,33 +757,8 @@ def _parse_word(filepath: str, config: OfficeParserConfig) -> str:
         FileCorrupted: If the file represented in the parsed file path is not in the expected format.
     """
 
-    # The target content xml files for the docx file
-    target_files_regex = r"word\/(document[\d+]?|footnotes[\d+]?|endnotes[\d+]?)\.xml"
-
-    # The decompress location which contains the filename in it.
-    decompress_location = f"{get_temp_files_location(config)}/{filepath.split('/').pop()}"
-
-    # Decompress docx files into the target xml files.
-    extracted_files = extract_files_with_regex(zip_path=filepath, extract_path=decompress_location,
-                                                             regex_pattern=target_files_regex)
-
-    # Verify if atleast the document xml file exists in the extracted files list.
-    # Otherwise, raise FileCorrupted error
-    if not any(re.match(r"word\/document[\d+]?\.xml", filename) for filename in extracted_files):
-        raise FileCorrupted(filepath)
-
-    # List of all file content
-    xml_content_array = []
-
-    # Read values in each file into an array.
-    try:
-        for local_file_path in extracted_files:
-            with open(file=f"{decompress_location}/{local_file_path}", mode='r', encoding='utf8') as file_content:
-                # Read the entire content of the file
-                xml_content_array.append(file_content.read())
-
-    except Exception as e:
-        raise FileCorrupted(filepath) from e
+    # Parsing configurations used throughout this function
+    newline_delimiter = get_newline_delimiter(config)
 
     # ************************************* word xml files explanation *************************************
     # Structure of xmlContent of a word file is simple.
@@ -340,32 +769,54 @@ def _parse_word(filepath: str, config: OfficeParserConfig) -> str:
     # Holds the response text
     response_text = []
 
-    # Iterate over the content array, get dom of the xml content of each file and fetch the text info from within
-    for xml_content in xml_content_array:
-        # Get iterable list of w:p elements
-        xml_paragraph_nodes_list = list(parseString(xml_content).getElementsByTagName('w:p'))
-        # Iterate over w:p elements to extract the w:t text from within
-        paragraph_text = []
-        for paragraph_node in xml_paragraph_nodes_list:
-            text_node_list = list(paragraph_node.getElementsByTagName('w:t'))
-            if text_node_list:
-                paragraph_text.append(''.join(text_node.firstChild.nodeValue for text_node in text_node_list if text_node.firstChild and text_node.firstChild.nodeValue is not None))
-        response_text.append(get_newline_delimiter(config).join(paragraph_text))
+    # Open the docx file to stream the target xml files out of it.
+    with open_zip_file(filepath, get_cache_decompressed_files(config)) as zip_ref:
+        # Find the target xml files in the docx file.
+        extracted_files = extract_files_with_regex(zip_ref, _WORD_RE)['content']
+
+        # Verify if atleast the document xml file exists in the extracted files list.
+        # Otherwise, raise FileCorrupted error
+        if not any(file_name.startswith(_WORD_DOCUMENT_PREFIX) for file_name in extracted_files):
+            raise FileCorrupted(get_file_name_for_errors(filepath))
+
+        if get_preserve_temp_files(config):
+            extract_files_to_disk(zip_ref, get_decompress_location(filepath, get_temp_files_location(config)), extracted_files)
+
+        # Iterate over the extracted files, stream the xml content of each file and fetch the text info from within
+        try:
+            for local_file_path in extracted_files:
+                # Iterate over streamed w:p elements to extract the w:t text from within
+                paragraph_text = []
+                with zip_ref.open(local_file_path) as xml_stream:
+                    for paragraph_node in iter_xml_elements(xml_stream, *_W_P_TAGS):
+                        # Skip paragraphs without any text nodes
+                        if has_descendant(paragraph_node, _W_T_TAGS):
+                            paragraph_text.append(''.join(_W_TEXT_XPATH(paragraph_node)))
+                response_text.append(paragraph_text)
+
+        except Exception as e:
+            raise FileCorrupted(get_file_name_for_errors(filepath)) from e
 
     # Join all response_text array
-    response_text = get_newline_delimiter(config).join(response_text)
+    response_text = join_text_groups(newline_delimiter, response_text)
 
     # Return the response text
     return response_text
 
 
-def _parse_powerpoint(filepath: str, config: OfficeParserConfig) -> str:
+# Files regex that hold our content of interest in pptx files
+_PPTX_RE = re.compile(r"(?P<content>ppt/(?:notesSlides|slides)/(?:notesSlide|slide)\d+.xml)")
+_PPTX_SLIDES_RE = re.compile(r"(?P<content>ppt/slides/slide\d+.xml)")
+# Prefix of the slide xml files among the content files
+_PPTX_SLIDES_PREFIX = 'ppt/slides/'
+
+def _parse_powerpoint(filepath: Union[str, BinaryIO], config: OfficeParserConfig) -> str:
     """
     This function parses PowerPoint files and returns the parsed text.
     It decides a few configurations of the parsing using the config object passed in the argument.
 
     Args:
-        filepath: The path of the pptx file that needs to be parsed.
+        filepath: The path of the pptx file that needs to be parsed or the file opened in binary mode.
         config: A config dictionary for parsing text from this file.
 
     Returns:
@@ -375,41 +826,10 @@ def _parse_powerpoint(filepath: str, config: OfficeParserConfig) -> str:
         FileCorrupted: If the file represented in the parsed file path is not in the expected format.
     """
 
-    # Files regex that hold our content of interest
-    all_files_regex = r"ppt/(notesSlides|slides)/(notesSlide|slide)\d+.xml"
-    slides_regex = r"ppt/slides/slide\d+.xml"
-
-    # The decompress location which contains the filename in it
-    decompress_location = f"{get_temp_files_location(config)}/{filepath.split('/').pop()}"
-
-    # Decompress pptx files into the target xml files.
-    extracted_files = extract_files_with_regex(zip_path=filepath, extract_path=decompress_location,
-                                                             regex_pattern=all_files_regex if not get_ignore_notes(
-                                                                 config) else slides_regex)
-
-    # Verify if atleast the slides xml files exist in the extracted files list.
-    # Otherwise, raise FileCorrupted error
-    if not any(re.match(slides_regex, filename) for filename in extracted_files):
-        raise FileCorrupted(filepath)
-
-    # Check if any sorting is required.
-    if not get_ignore_notes(config) and get_put_notes_at_last(config):
-        # Sort files according to previous order of taking text out of ppt/slides followed by ppt/notesSlides
-        # For this, we are looking at the presence of notes string in the file name. If it exists, it goes to the end.
-        extracted_files.sort(key=lambda x: (1 if 'notes' in x else 0, x.find('notes') if 'notes' in x else len(x)))
-
-    # Returning an array of all the xml contents read using fs.readFileSync
-    xml_content_array = []
-
-    # Read values in each file into an array.
-    try:
-        for local_file_path in extracted_files:
-            with open(file=f"{decompress_location}/{local_file_path}", mode='r', encoding='utf8') as file_content:
-                # Read the entire content of the file
-                xml_content_array.append(file_content.read())
-
-    except Exception as e:
-        raise FileCorrupted(filepath) from e
+    # Parsing configurations used throughout this function
+    newline_delimiter = get_newline_delimiter(config)
+    ignore_notes = get_ignore_notes(config)
+    put_notes_at_last = get_put_notes_at_last(config)
 
     # ******************************** powerpoint xml files explanation ************************************
     # Structure of xmlContent of a powerpoint file is simple.
@@ -421,32 +841,63 @@ def _parse_powerpoint(filepath: str, config: OfficeParserConfig) -> str:
     # Holds the response text
     response_text = []
 
-    # Iterate over the content array, get dom of the xml content of each file and fetch the text info from within
-    for xml_content in xml_content_array:
-        # Get iterable list of a:p elements
-        xml_paragraph_nodes_list = list(parseString(xml_content).getElementsByTagName('a:p'))
-        # Iterate over a:p elements to extract the a:t text from within
-        paragraph_text = []
-        for paragraph_node in xml_paragraph_nodes_list:
-            text_node_list = list(paragraph_node.getElementsByTagName('a:t'))
-            if text_node_list:
-                paragraph_text.append(''.join(text_node.firstChild.nodeValue for text_node in text_node_list if text_node.firstChild and text_node.firstChild.nodeValue is not None))
-        response_text.append(get_newline_delimiter(config).join(paragraph_text))
+    # Open the pptx file to stream the target xml files out of it.
+    with open_zip_file(filepath, get_cache_decompressed_files(config)) as zip_ref:
+        # Find the target xml files in the pptx file.
+        extracted_files = extract_files_with_regex(zip_ref, _PPTX_RE if not ignore_notes else _PPTX_SLIDES_RE)['content']
+
+        # Verify if atleast the slides xml files exist in the extracted files list.
+        # Otherwise, raise FileCorrupted error
+        if not any(file_name.startswith(_PPTX_SLIDES_PREFIX) for file_name in extracted_files):
+            raise FileCorrupted(get_file_name_for_errors(filepath))
+
+        if get_preserve_temp_files(config):
+            extract_files_to_disk(zip_ref, get_decompress_location(filepath, get_temp_files_location(config)), extracted_files)
+
+        # Check if any sorting is required.
+        if not ignore_notes and put_notes_at_last:
+            # Sort files according to previous order of taking text out of ppt/slides followed by ppt/notesSlides
+            # For this, we are looking at the presence of notes string in the file name. If it exists, it goes to the end.
+            extracted_files.sort(key=lambda x: (1 if 'notes' in x else 0, x.find('notes') if 'notes' in x else len(x)))
+
+        # Stream the xml content of a slide or notes file and fetch the text info from within
+        def parse_slide(local_file_path: str) -> List[str]:
+            # Iterate over streamed a:p elements to extract the a:t text from within
+            paragraph_text = []
+            with zip_ref.open(local_file_path) as xml_stream:
+                for paragraph_node in iter_xml_elements(xml_stream, *_A_P_TAGS):
+                    # Skip paragraphs without any text nodes
+                    if has_descendant(paragraph_node, _A_T_TAGS):
+                        paragraph_text.append(''.join(_A_TEXT_XPATH(paragraph_node)))
+            return paragraph_text
+
+        # Parse the extracted files alongside each other while keeping their sorted order
+        try:
+            response_text = map_in_threads(parse_slide, extracted_files)
+
+        except Exception as e:
+            raise FileCorrupted(get_file_name_for_errors(filepath)) from e
 
     # Join all response_text array
-    response_text = get_newline_delimiter(config).join(response_text)
+    response_text = join_text_groups(newline_delimiter, response_text)
 
     # Return the response text
     return response_text
 
 
-def _parse_excel(filepath: str, config: OfficeParserConfig) -> str:
+# Files regex that hold our content of interest in xlsx files, with a group for each kind of file
+_XLSX_RE = re.compile(r"(?P<sheet_files>xl/worksheets/sheet\d+.xml)"
+                      r"|(?P<drawing_files>xl/drawings/drawing\d+.xml)"
+                      r"|(?P<chart_files>xl/charts/chart\d+.xml)"
+                      r"|(?P<shared_strings_files>xl/sharedStrings.xml$)")
+
+def _parse_excel(filepath: Union[str, BinaryIO], config: OfficeParserConfig) -> str:
     """
     This function parses Excel files and returns the parsed text.
     It decides a few configurations of the parsing using the config object passed in the argument.
 
     Args:
-        filepath: The path of the xlsx file that needs to be parsed.
+        filepath: The path of the xlsx file that needs to be parsed or the file opened in binary mode.
         config: A config dictionary for parsing text from this file.
 
     Returns:
@@ -456,48 +907,8 @@ def _parse_excel(filepath: str, config: OfficeParserConfig) -> str:
         FileCorrupted: If the file represented in the parsed file path is not in the expected format.
     """
 
-    # Files regex that hold our content of interest
-    sheets_regex = r"xl/worksheets/sheet\d+.xml"
-    drawings_regex = r"xl/drawings/drawing\d+.xml"
-    charts_regex = r"xl/charts/chart\d+.xml"
-    strings_file_path = 'xl/sharedStrings.xml'
-
-    # The decompress location which contains the filename in it
-    decompress_location = f"{get_temp_files_location(config)}/{filepath.split('/').pop()}"
-
-    # Decompress xlsx files into the target xml files.
-    extracted_files = extract_files_with_regex(zip_path=filepath, extract_path=decompress_location,
-                                                             regex_pattern=f"{sheets_regex}|{drawings_regex}|{charts_regex}|{strings_file_path}")
-
-    # Verify if atleast the slides xml files exist in the extracted files list.
-    # Otherwise, raise FileCorrupted error
-    if not any(re.match(sheets_regex, filename) for filename in extracted_files):
-        raise FileCorrupted(filepath)
-
-    # Read values in each file into an object.
-    xml_content_files_object: Dict[str, List[str]] = {
-        'sheet_files': [],
-        'drawing_files': [],
-        'chart_files': [],
-        'shared_strings_file': ''
-    }
-
-    try:
-        for local_file_path in extracted_files:
-            with open(file=f"{decompress_location}/{local_file_path}", mode='r', encoding='utf8') as file_content:
-                # Read the entire content of the file
-                content = file_content.read()
-                if local_file_path.startswith('xl/worksheets'):
-                    xml_content_files_object['sheet_files'].append(content)
-                elif local_file_path.startswith('xl/drawings'):
-                    xml_content_files_object['drawing_files'].append(content)
-                elif local_file_path.startswith('xl/charts'):
-                    xml_content_files_object['chart_files'].append(content)
-                elif local_file_path == strings_file_path:
-                    xml_content_files_object['shared_strings_file'] = content
-
-    except Exception as e:
-        raise FileCorrupted(filepath) from e
+    # Parsing configurations used throughout this function
+    newline_delimiter = get_newline_delimiter(config)
 
     # ********************************** excel xml files explanation ***************************************
     # Structure of xmlContent of an excel file is a bit complex.
@@ -508,70 +919,112 @@ def _parse_excel(filepath: str, config: OfficeParserConfig) -> str:
     # Drawing files contain all text for each drawing and have text nodes in a:t and paragraph nodes in a:p.
     # ******************************************************************************************************
 
-    # Holds the response text
-    response_text = []
-
-    # Find text nodes with t tags in sharedStrings xml file
-    shared_strings_xml_t_nodes_list = list(
-        parseString(xml_content_files_object['shared_strings_file']).getElementsByTagName('t'))
-    # Create shared string array. This will be used as a map to get strings from within sheet files.
-    shared_strings = [t_node.firstChild.nodeValue if t_node.firstChild and t_node.firstChild.nodeValue is not None else '' for t_node in shared_strings_xml_t_nodes_list]
-
-    # Parse Sheet files
-    for sheet_xml_content in xml_content_files_object['sheet_files']:
-        # Find text nodes with c tags in sharedStrings xml file
-        sheets_xml_c_nodes_list = list(parseString(sheet_xml_content).getElementsByTagName('c'))
-        # Traverse through the nodes list and fill response_text with either the number value in its v node or find a mapped string from shared_strings.
-        response_text.append(
-            get_newline_delimiter(config).join([
-                (shared_strings[
-                     int(c_node.getElementsByTagName('v')[0].firstChild.nodeValue)] if c_node.getAttribute(
-                    't') == 's' else c_node.getElementsByTagName('v')[0].firstChild.nodeValue)
-                for c_node in sheets_xml_c_nodes_list if c_node.getElementsByTagName('v') and c_node.getElementsByTagName('v')[0].firstChild and c_node.getElementsByTagName('v')[0].firstChild.nodeValue is not None
-            ])
-        )
-
-    # Parse Drawing files
-    for drawing_xml_content in xml_content_files_object['drawing_files']:
-        # Find text nodes with a:p tags
-        drawings_xml_paragraph_nodes_list = list(parseString(drawing_xml_content).getElementsByTagName('a:p'))
-        # Store all the text content to respond
-        response_text.append(
-            get_newline_delimiter(config).join([
-                ''.join([
-                    text_node.firstChild.nodeValue
-                    for text_node in paragraph_node.getElementsByTagName('a:t')
-                    if text_node.firstChild and text_node.firstChild.nodeValue is not None
-                ])
-                for paragraph_node in drawings_xml_paragraph_nodes_list if paragraph_node.getElementsByTagName('a:t')
-            ])
-        )
-
-    # Parse Chart files
-    for chart_xml_content in xml_content_files_object['chart_files']:
-        # Find text nodes with c:v tags
-        charts_xml_cv_nodes_list = list(parseString(chart_xml_content).getElementsByTagName('c:v'))
-        # Store all the text content to respond
-        response_text.append(get_newline_delimiter(config).join([
-            c_v_node.firstChild.nodeValue
-            for c_v_node in charts_xml_cv_nodes_list
-            if c_v_node.firstChild and c_v_node.firstChild.nodeValue is not None
-        ]))
+    # Open the xlsx file to stream the target xml files out of it.
+    with open_zip_file(filepath, get_cache_decompressed_files(config)) as zip_ref:
+        # Find the target xml files in the xlsx file.
+        # The names of the extracted files come sorted into an object by their kind.
+        xml_content_files_object = extract_files_with_regex(zip_ref, _XLSX_RE)
+
+        # Verify if atleast the sheet xml files exist in the extracted files list.
+        # Otherwise, raise FileCorrupted error
+        if not xml_content_files_object['sheet_files']:
+            raise FileCorrupted(get_file_name_for_errors(filepath))
+
+        if get_preserve_temp_files(config):
+            extract_files_to_disk(zip_ref, get_decompress_location(filepath, get_temp_files_location(config)),
+                                  [file for files in xml_content_files_object.values() for file in files])
+
+        try:
+            # Create shared string array from the si tags in sharedStrings xml file. This will be used as a map to get strings from within sheet files.
+            # Rich text strings split their text into multiple t tags within r tags of the same si tag, so they are joined together.
+            # The t tags within rPh tags only hold phonetic hints for the string and are not a part of it.
+            # Workbooks without any string cells do not have a sharedStrings xml file at all.
+            shared_strings = []
+            if xml_content_files_object['shared_strings_files']:
+                with zip_ref.open(xml_content_files_object['shared_strings_files'][0]) as xml_stream:
+                    shared_strings = [''.join(t_node.text or '' for t_node in si_node.iter(*_SS_T_TAGS)
+                                              if t_node.getparent().tag not in _SS_RPH_TAGS)
+                                      for si_node in iter_xml_elements(xml_stream, *_SS_SI_TAGS)]
+
+            # Parse Sheet files
+            def parse_sheet(xml_stream: BinaryIO) -> List[str]:
+                cell_values = []
+                # Stream nodes with c tags in the sheet xml file.
+                # Traverse through the nodes and fill cell_values with either the number value in its v node or find a mapped string from shared_strings.
+                for c_node in iter_xml_elements(xml_stream, *_SS_C_TAGS):
+                    v_node = next(c_node.iterchildren(*_SS_V_TAGS), None)
+                    if v_node is None or v_node.text is None:
+                        continue
+                    cell_value = v_node.text
+                    if c_node.get('t') == 's':
+                        cell_value = shared_strings[int(cell_value)]
+                    cell_values.append(cell_value)
+                return cell_values
+
+            # Parse Drawing files
+            def parse_drawing(xml_stream: BinaryIO) -> List[str]:
+                # Stream nodes with a:p tags
+                drawings_xml_paragraph_nodes = iter_xml_elements(xml_stream, *_A_P_TAGS)
+                # Return all the text content to respond
+                return [
+                    ''.join(_A_TEXT_XPATH(paragraph_node))
+                    for paragraph_node in drawings_xml_paragraph_nodes if has_descendant(paragraph_node, _A_T_TAGS)
+                ]
+
+            # Parse Chart files
+            def parse_chart(xml_stream: BinaryIO) -> List[str]:
+                # Stream nodes with c:v tags
+                charts_xml_cv_nodes = iter_xml_elements(xml_stream, *_C_V_TAGS)
+                # Return all the text content to respond
+                return [
+                    c_v_node.text
+                    for c_v_node in charts_xml_cv_nodes
+                    if c_v_node.text is not None
+                ]
+
+            # Open the stream of a file and parse it with its parsing function
+            def run_parsing_task(task) -> List[str]:
+                parse_function, local_file_path = task
+                with zip_ref.open(local_file_path) as xml_stream:
+                    return parse_function(xml_stream)
+
+            # Parse all the files alongside each other, keeping sheets first, then drawings and then charts in the response text
+            parsing_tasks = [*((parse_sheet, name) for name in xml_content_files_object['sheet_files']),
+                             *((parse_drawing, name) for name in xml_content_files_object['drawing_files']),
+                             *((parse_chart, name) for name in xml_content_files_object['chart_files'])]
+            response_text = map_in_threads(run_parsing_task, parsing_tasks)
+
+        except Exception as e:
+            raise FileCorrupted(get_file_name_for_errors(filepath)) from e
 
     # Join all response_text array
-    response_text = get_newline_delimiter(config).join(response_text)
+    response_text = join_text_groups(newline_delimiter, response_text)
 
     # Return the response text
     return response_text
 
 
-def _parse_open_office(filepath: str, config: OfficeParserConfig) -> str:
+# The target content xml files for the OpenOffice file
+_OPEN_OFFICE_MAIN_CONTENT_FILE_PATH = 'content.xml'
+# Files regex with a group for the main content file and one for the content files of embedded objects
+_OPEN_OFFICE_RE = re.compile(rf"(?P<main_content_files>{_OPEN_OFFICE_MAIN_CONTENT_FILE_PATH}$)"
+                             r"|(?P<object_content_files>Object \d+/content.xml)")
+# Prefix of all the tags in the text namespace of OpenOffice files
+_OPEN_OFFICE_TEXT_NAMESPACE_PREFIX = f"{{{NS_TEXT}}}"
+# Set of allowed text tags in OpenOffice files
+_OPEN_OFFICE_TEXT_TAGS = frozenset({f"{{{NS_TEXT}}}p", f"{{{NS_TEXT}}}h"})
+# Notes tag in OpenOffice files
+_OPEN_OFFICE_NOTES_TAG = f"{{{NS_PRESENTATION}}}notes"
+# Tags streamed out of the OpenOffice xml files
+_OPEN_OFFICE_STREAMED_TAGS = (*_OPEN_OFFICE_TEXT_TAGS, _OPEN_OFFICE_NOTES_TAG)
+
+def _parse_open_office(filepath: Union[str, BinaryIO], config: OfficeParserConfig) -> str:
     """
     This function parses OpenOffice files and returns the parsed text.
     It decides a few configurations of the parsing using the config object passed in the argument.
 
     Args:
-        filepath: The path of the ods file that needs to be parsed.
+        filepath: The path of the ods file that needs to be parsed or the file opened in binary mode.
         config: A config dictionary for parsing text from this file.
 
     Returns:
@@ -581,40 +1034,14 @@ def _parse_open_office(filepath: str, config: OfficeParserConfig) -> str:
         FileCorrupted: If the file represented in the parsed file path is not in the expected format.
     """
 
-    # The target content xml file for the OpenOffice file
-    main_content_file_path = 'content.xml'
-    object_content_files_regex = r"Object \d+/content.xml"
-
-    # The decompress location which contains the filename in it
-    decompress_location = f"{get_temp_files_location(config)}/{filepath.split('/').pop()}"
-
-    # Decompress ods files into the target xml files.
-    extracted_files = extract_files_with_regex(zip_path=filepath, extract_path=decompress_location,
-                                                             regex_pattern=f"{main_content_file_path}|{object_content_files_regex}")
-
-    # Verify if atleast the content xml file exists in the extracted files list.
-    # Otherwise, raise FileCorrupted error
-    if main_content_file_path not in extracted_files:
-        raise FileCorrupted(filepath)
-
-    # Read values in each file into an object.
-    xml_content_files_object: Dict[str, List[str]] = {
-        'main_content_file': '',
-        'object_content_files': []
-    }
-
-    try:
-        for local_file_path in extracted_files:
-            with open(file=f"{decompress_location}/{local_file_path}", mode='r', encoding='utf8') as file_content:
-                # Read the entire content of the file
-                content = file_content.read()
-                if local_file_path == main_content_file_path:
-                    xml_content_files_object['main_content_file'] = content
-                elif local_file_path.startswith("Object"):
-                    xml_content_files_object['object_content_files'].append(content)
-
-    except Exception as e:
-        raise FileCorrupted(filepath) from e
+    # Parsing configurations used throughout this function
+    newline_delimiter = get_newline_delimiter(config)
+    ignore_notes = get_ignore_notes(config)
+    put_notes_at_last = get_put_notes_at_last(config)
+    # Delimiter added after the text of every nested text tag. A new line is used when no delimiter is configured.
+    text_tag_delimiter = newline_delimiter or "\n"
+    # Notes text is kept apart from the rest of the text when it is ignored or put at the end of the response text.
+    separate_notes_text = put_notes_at_last or ignore_notes
 
     # ********************************** openoffice xml files explanation **********************************
     # Structure of xmlContent of OpenOffice files is simple.
@@ -628,90 +1055,235 @@ def _parse_open_office(filepath: str, config: OfficeParserConfig) -> str:
     # Holds the notes text
     notes_text = []
 
-    # List of allowed text tags
-    allowed_text_tags = ["text:p", "text:h"]
-    # Notes tag
-    notes_tag = "presentation:notes"
-
-    # Main dfs traversal function that goes from one node to its children and returns the value out.
-    def extract_all_texts_from_node(root):
+    # Main function that extracts the text of a node and returns the value out.
+    def extract_all_texts_from_node(root, is_notes_node):
         xml_text_array = []
-        for _, child_node in enumerate(root.childNodes):
-            traversal(child_node, xml_text_array, True)
+        # The text of notes nodes goes either in the notes text or in the text array for the whole node.
+        target_text_array = notes_text if is_notes_node and separate_notes_text else xml_text_array
+        traversal(root, target_text_array, True)
         return "".join(xml_text_array)
 
-    # Traversal function that gets recursive calling.
-    def traversal(node, xml_text_array, is_first_recursion):
-        if not node.childNodes or len(node.childNodes) == 0:
-            parent_node = node.parentNode if node.parentNode else None
-            if parent_node and getattr(parent_node, 'tagName', '').startswith('text') and node.nodeValue:
-                if is_notes_node(parent_node) and (
-                        get_put_notes_at_last(config) or get_ignore_notes(
-                        config)):
-                    notes_text.append(node.nodeValue)
-                    if getattr(parent_node, 'tagName', '') in allowed_text_tags and not is_first_recursion:
-                        notes_text.append(get_newline_delimiter(config) or "\n")
-                else:
-                    xml_text_array.append(node.nodeValue)
-                    if getattr(parent_node, 'tagName', '') in allowed_text_tags and not is_first_recursion:
-                        xml_text_array.append(get_newline_delimiter(config) or "\n")
+    # Dfs traversal function that goes from one node to its children.
+    # lxml keeps the text of a node in its text attribute and the text following each child node in that child's tail,
+    # so both of them belong to the node itself.
+    # Comments and processing instructions are children as well. Their own text is skipped, but the text following them is not.
+    def traversal(node, target_text_array, is_first_recursion):
+        if node.text:
+            collect_text(node, node.text, target_text_array, is_first_recursion)
+        for child_node in node.iterchildren():
+            if isinstance(child_node.tag, str):
+                traversal(child_node, target_text_array, False)
+            if child_node.tail:
+                collect_text(node, child_node.tail, target_text_array, is_first_recursion)
+
+    # Stores a text value held by the parent node in the target text array.
+    def collect_text(parent_node, text, target_text_array, is_first_recursion):
+        if not parent_node.tag.startswith(_OPEN_OFFICE_TEXT_NAMESPACE_PREFIX):
             return
-
-        for _, child_node in enumerate(node.childNodes):
-            traversal(child_node, xml_text_array, False)
-
-    # Checks if the given node has an ancestor which is a notes tag. We use this information to put the notes in the response text and its position.
-    def is_notes_node(node):
-        if hasattr(node, 'tagName') and node.tagName == notes_tag:
-            return True
-        if node.parentNode:
-            return is_notes_node(node.parentNode)
-        return False
-
-    # Checks if the given node has an ancestor which is also an allowed text tag. In that case, we ignore the child text tag.
-    def is_invalid_text_node(node):
-        if hasattr(node, 'tagName') and getattr(node, 'tagName', '') in allowed_text_tags:
-            return True
-        if node.parentNode:
-            return is_invalid_text_node(node.parentNode)
-        return False
-
-    # The xml string parsed as xml array
-    xml_content_array = [parseString(xml_content_files_object['main_content_file']),
-                         *map(parseString, xml_content_files_object['object_content_files'])]
-
-    # Iterate over each xml_content and extract text from them.
-    for xml_content in xml_content_array:
-        # Find text nodes with text:h and text:p tags in xml_content
-        xml_text_nodes_list = [node for node in list(xml_content.getElementsByTagName("*")) if
-                               hasattr(node, 'tagName') and getattr(node, 'tagName',
-                                                                    '') in allowed_text_tags and not is_invalid_text_node(
-                                   node.parentNode)]
-        # Store all the non-empty text content to respond
-        non_empty_texts = [text for text_node in xml_text_nodes_list if
-                           (text := extract_all_texts_from_node(text_node))]
-        if non_empty_texts:
-            response_text.append(get_newline_delimiter(config).join(non_empty_texts))
+        target_text_array.append(text)
+        if parent_node.tag in _OPEN_OFFICE_TEXT_TAGS and not is_first_recursion:
+            target_text_array.append(text_tag_delimiter)
+
+    # Open the OpenOffice file to stream the target xml files out of it.
+    with open_zip_file(filepath, get_cache_decompressed_files(config)) as zip_ref:
+        # Find the target xml files in the OpenOffice file.
+        extracted_file_groups = extract_files_with_regex(zip_ref, _OPEN_OFFICE_RE)
+
+        # Verify if atleast the content xml file exists in the extracted files list.
+        # Otherwise, raise FileCorrupted error
+        if not extracted_file_groups['main_content_files']:
+            raise FileCorrupted(get_file_name_for_errors(filepath))
+
+        # Names of all the xml files to be parsed, the main content file followed by the object content files
+        xml_file_names = [*extracted_file_groups['main_content_files'], *extracted_file_groups['object_content_files']]
+
+        if get_preserve_temp_files(config):
+            extract_files_to_disk(zip_ref, get_decompress_location(filepath, get_temp_files_location(config)), xml_file_names)
+
+        # Iterate over each xml file and extract text from them.
+        try:
+            for xml_file_name in xml_file_names:
+                # Number of open notes tags and text tags around the current node.
+                # Notes text is put in its position in the response text depending on notes_depth.
+                # Text tags within another text tag are ignored as they are already a part of the outermost one.
+                notes_depth = 0
+                text_depth = 0
+                with zip_ref.open(xml_file_name) as xml_stream:
+                    # Stream text nodes with text:h and text:p tags from the xml content along with the notes tags around them
+                    for event, node in etree.iterparse(xml_stream, events=('start', 'end'), tag=_OPEN_OFFICE_STREAMED_TAGS,
+                                                     **_XML_PARSER_OPTIONS):
+                        if node.tag == _OPEN_OFFICE_NOTES_TAG:
+                            notes_depth += 1 if event == 'start' else -1
+                            continue
+
+                        if event == 'start':
+                            text_depth += 1
+                            continue
+
+                        text_depth -= 1
+                        if text_depth:
+                            continue
+
+                        # Store all the non-empty text content to respond
+                        if text := extract_all_texts_from_node(node, notes_depth > 0):
+                            response_text.append(text)
+
+                        # Free the text node and the references its parent holds to the siblings that were consumed before it.
+                        node.clear()
+                        while node.getprevious() is not None:
+                            del node.getparent()[0]
+
+        except Exception as e:
+            raise FileCorrupted(get_file_name_for_errors(filepath)) from e
 
     # Add notes text at the end if the user config says so.
     # Note that we already have pushed the text content to notes_text array while extracting all texts from the nodes.
-    if not get_ignore_notes(config) and get_put_notes_at_last(config):
+    if not ignore_notes and put_notes_at_last:
         response_text.extend(notes_text)
 
     # Join all response_text array
-    response_text = get_newline_delimiter(config).join(response_text)
+    response_text = newline_delimiter.join(response_text)
 
     # Return the response text
     return response_text
 
 
-def _parse_pdf(filepath: str, config: OfficeParserConfig) -> str:
+# Modules of the libraries that can extract text out of PDF files, keyed by the name of the backend.
+# pdfminer.six is always installed. The other ones are optional and only imported when they are chosen.
+_PDF_BACKEND_MODULES = {
+    'pdfminer': 'pdfminer',
+    'pymupdf': 'pymupdf',
+    'pypdfium2': 'pypdfium2',
+}
+
+# Least number of pages of a PDF file parsed by a single process when pdfminer.six parses its pages in multiple processes.
+# Fewer pages do not make up for the time spent in starting a process and opening the file in it.
+PDF_MIN_PAGES_PER_WORKER = 4
+
+def extract_text_from_pdf(pdf_file: BinaryIO, page_numbers: Optional[List[int]] = None, fast_mode: bool = False) -> str:
+    """
+    Extract the text of a PDF file with pdfminer.six, writing the text of each page into a single buffer as it is laid out.
+
+    Args:
+        pdf_file (BinaryIO): The PDF file opened in binary mode.
+        page_numbers (List[int], optional): Zero based numbers of the pages to extract the text from. All pages if None.
+        fast_mode (bool, optional): Skip the layout analysis that groups characters into lines and text boxes.
+                                    The text comes out in the order it is drawn, without line breaks.
+
+    Returns:
+        str: The text of the pages.
+    """
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    resource_manager = PDFResourceManager(caching=True)
+    with StringIO() as output:
+        device = TextConverter(resource_manager, output, laparams=None if fast_mode else LAParams())
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        for page in PDFPage.get_pages(pdf_file, page_numbers):
+            interpreter.process_page(page)
+        device.close()
+        return output.getvalue()
+
+def _extract_pdf_pages_text_with_pdfminer(pdf_source: Union[str, bytes], page_numbers: Optional[List[int]], fast_mode: bool) -> str:
+    """
+    Extract the text of a few pages of a PDF file with pdfminer.six.
+
+    Args:
+        pdf_source (Union[str, bytes]): The path or the content of the PDF file.
+        page_numbers (List[int], optional): Zero based numbers of the pages to extract the text from. All pages if None.
+        fast_mode (bool): Skip the layout analysis.
+
+    Returns:
+        str: The text of the pages.
+    """
+    with open_binary_file(pdf_source if isinstance(pdf_source, str) else BytesIO(pdf_source)) as file:
+        return extract_text_from_pdf(file, page_numbers, fast_mode)
+
+def _extract_pdf_text_with_pdfminer_in_processes(pdf_file: Union[str, BinaryIO], max_workers: int, fast_mode: bool) -> str:
+    """
+    Extract the text of a PDF file with pdfminer.six by splitting its pages into consecutive runs parsed in a pool of processes.
+    Every page is laid out on its own, so joining the text of the runs in their order gives the text of the whole file.
+
+    Args:
+        pdf_file (Union[str, BinaryIO]): The path of the PDF file or the file opened in binary mode.
+        max_workers (int): Upper limit of processes used.
+        fast_mode (bool): Skip the layout analysis.
+
+    Returns:
+        str: The text of all the pages.
+    """
+    from pdfminer.pdfpage import PDFPage
+
+    # File objects cannot be shared with other processes, so the workers get the content of in memory files instead
+    pdf_source = pdf_file if isinstance(pdf_file, str) else pdf_file.read()
+
+    with open_binary_file(pdf_source if isinstance(pdf_source, str) else BytesIO(pdf_source)) as file:
+        page_count = sum(1 for _ in PDFPage.get_pages(file))
+
+    # Split the pages into a run of consecutive pages per process
+    pages_per_worker = max(PDF_MIN_PAGES_PER_WORKER, -(-page_count // max_workers))
+    page_runs = [list(range(first_page, min(first_page + pages_per_worker, page_count)))
+                 for first_page in range(0, page_count, pages_per_worker)]
+
+    # Not worth starting any process for a single run of pages
+    if len(page_runs) < 2:
+        return _extract_pdf_pages_text_with_pdfminer(pdf_source, None, fast_mode)
+
+    with ProcessPoolExecutor(max_workers=len(page_runs)) as executor:
+        return "".join(executor.map(_extract_pdf_pages_text_with_pdfminer, itertools.repeat(pdf_source), page_runs,
+                                    itertools.repeat(fast_mode)))
+
+def _extract_pdf_text_with_pymupdf(pdf_file: Union[str, BinaryIO]) -> str:
+    """
+    Extract the text of a PDF file with PyMuPDF.
+
+    Args:
+        pdf_file (Union[str, BinaryIO]): The path of the PDF file or the file opened in binary mode.
+
+    Returns:
+        str: The text of all the pages separated by new lines.
+    """
+    import pymupdf
+
+    document = pymupdf.open(pdf_file) if isinstance(pdf_file, str) else pymupdf.open(stream=pdf_file.read(), filetype="pdf")
+    with document:
+        return "\n".join(page.get_text() for page in document)
+
+def _extract_pdf_text_with_pypdfium2(pdf_file: Union[str, BinaryIO]) -> str:
+    """
+    Extract the text of a PDF file with pypdfium2.
+
+    Args:
+        pdf_file (Union[str, BinaryIO]): The path of the PDF file or the file opened in binary mode.
+
+    Returns:
+        str: The text of all the pages separated by new lines.
+    """
+    import pypdfium2
+
+    document = pypdfium2.PdfDocument(pdf_file)
+    try:
+        page_texts = []
+        for page in document:
+            text_page = page.get_textpage()
+            # PDFium ends lines with \r\n
+            page_texts.append(text_page.get_text_range().replace("\r\n", "\n"))
+            text_page.close()
+            page.close()
+        return "\n".join(page_texts)
+    finally:
+        document.close()
+
+def _parse_pdf(filepath: Union[str, BinaryIO], config: OfficeParserConfig) -> str:
     """
     This function parses PDF files and returns the parsed text.
     It can also replace newline characters with the specified delimiter in the config object.
 
     Args:
-        filepath: The path of the PDF file that needs to be parsed.
+        filepath: The path of the PDF file that needs to be parsed or the file opened in binary mode.
         config: A config dictionary for parsing text from this file.
 
     Returns:
@@ -719,26 +1291,59 @@ def _parse_pdf(filepath: str, config: OfficeParserConfig) -> str:
 
     Raises:
         FileCorrupted: If the file represented in the parsed file path is not in the expected format.
+        ImproperArguments: If the pdf backend in the config is not a known one.
     """
-    # Read PDF content
-    with open(filepath, "rb") as file:
-        pdf_data = BytesIO(file.read())
+    # Parsing configurations used throughout this function
+    newline_delimiter = get_newline_delimiter(config)
+    pdf_backend = get_pdf_backend(config)
+    pdf_max_workers = get_pdf_max_workers(config)
+    pdf_fast_mode = get_pdf_fast_mode(config)
+
+    if pdf_backend not in _PDF_BACKEND_MODULES:
+        raise ImproperArguments
+    # Fall back to pdfminer.six when the library of the chosen backend is not installed
+    if importlib.util.find_spec(_PDF_BACKEND_MODULES[pdf_backend]) is None:
+        pdf_backend = 'pdfminer'
 
     try:
-        # Extract text using pdfminer.six
-        response_text = extract_text_from_pdf(pdf_data)
-
-        # Replace newline characters if specified in the config
-        if get_newline_delimiter(config) and get_newline_delimiter(
-                config) != "\n":
-            response_text = response_text.replace("\n", get_newline_delimiter(config))
+        if pdf_backend == 'pymupdf':
+            response_text = _extract_pdf_text_with_pymupdf(filepath)
+        elif pdf_backend == 'pypdfium2':
+            response_text = _extract_pdf_text_with_pypdfium2(filepath)
+        elif pdf_max_workers > 1:
+            # Extract text using pdfminer.six with the pages split across processes
+            response_text = _extract_pdf_text_with_pdfminer_in_processes(filepath, pdf_max_workers, pdf_fast_mode)
+        else:
+            # Open the PDF file. pdfminer.six seeks through the file object itself, so its content is not read into memory first.
+            with open_binary_file(filepath) as file:
+                # Extract text using pdfminer.six
+                response_text = extract_text_from_pdf(file, fast_mode=pdf_fast_mode)
+
+        # Replace newline characters if specified in the config. Nothing is scanned for the default delimiter.
+        # pdfminer.six has no setting for the line separator and writes its text a character at a time,
+        # so a single replace over the extracted text is cheaper than replacing inside the conversion.
+        # str.replace is also faster than str.translate even for single character delimiters, as translate goes through
+        # its mapping for every character and falls back to a much slower path for text that is not ASCII.
+        if newline_delimiter and newline_delimiter != "\n":
+            response_text = response_text.replace("\n", newline_delimiter)
     # Handle any error from pdf parsing as a file corrupted error.
     except Exception as e:
-        raise FileCorrupted(filepath) from e
+        raise FileCorrupted(get_file_name_for_errors(filepath)) from e
 
     return response_text
 
 
+# Parsing function of each supported file extension
+_PARSER_BY_EXTENSION: Dict[str, Callable[[Union[str, BinaryIO], OfficeParserConfig], str]] = {
+    'docx': _parse_word,
+    'pptx': _parse_powerpoint,
+    'xlsx': _parse_excel,
+    'odt': _parse_open_office,
+    'odp': _parse_open_office,
+    'ods': _parse_open_office,
+    'pdf': _parse_pdf,
+}
+
 def parse_office(file: Union[str, bytes], config: OfficeParserConfig = None) -> str:
     """
     Parse the content of an office file (docx, pptx, xlsx, odt, odp, ods, pdf) and return the text content.
@@ -755,79 +1360,128 @@ def parse_office(file: Union[str, bytes], config: OfficeParserConfig = None) ->
         FileCorrupted: If the file is corrupted.
         FileDoesNotExist: If the file does not exist.
         ImproperBuffers: If the buffers are not proper.
+        ImproperArguments: If the pdf backend in the config is not a known one.
     """
     # Create internal config as a copy of the config passed in argument
     internal_config = config.copy() if config else {}
     # Check if temp_files_location is passed in the config
     if internal_config.get('temp_files_location') is not None:
-        internal_config[
-            'temp_files_location'] = f"{get_temp_files_location(internal_config)}{'' if get_temp_files_location(internal_config).endswith('/') else '/'}{default_temp_files_location}"
+        internal_config['temp_files_location'] = os.path.join(get_temp_files_location(internal_config), default_temp_files_location)
 
-    try:
-        # Create temp file subdirectory if it does not exist
-        os.makedirs(os.path.join(get_temp_files_location(internal_config), 'tempfiles'),
-                    exist_ok=True)
+    # Configurations used throughout this function
+    temp_files_location = get_temp_files_location(internal_config)
+    preserve_temp_files = get_preserve_temp_files(internal_config)
+    output_error_to_console = get_output_error_to_console(internal_config)
 
-        # New file path for the file passed in argument
-        new_file_path = ''
+    try:
+        # New file path for the file passed in argument, or the in memory file for buffers that are parsed without a temp file
+        new_file_path: Union[str, BinaryIO] = ''
         # Check if buffer
         if isinstance(file, bytes):
             # Guess file type from buffer
             file_type = get_file_extension_from_bytes(file)
-            if file_type:
+            if file_type and not preserve_temp_files:
+                # The parsers read the buffer through a file object, so it is only written to a temp file to preserve it
+                new_file_path = BytesIO(file)
+            elif file_type:
+                # Create temp file subdirectory if it does not exist
+                make_temp_files_directory(temp_files_location)
                 # temp file name
-                new_file_path = get_new_file_name(
-                    get_temp_files_location(internal_config), file_type)
+                new_file_path = get_new_file_name(temp_files_location, file_type)
                 # write new file
                 with open(new_file_path, 'wb') as new_file:
                     new_file.write(file)
             else:
                 raise ImproperBuffers
+            # File extension of the buffer
+            extension = file_type
         # Not buffers but real file path.
         else:
             # Check if file exists
             if not os.path.exists(file):
                 raise FileDoesNotExist(file)
 
-            # temp file name
-            new_file_path = get_new_file_name(get_temp_files_location(internal_config),
-                                                         file.split('.').pop().lower())
-            # Copy the file into a temp location with the temp name
-            shutil.copy2(file, new_file_path)
-
-        # File extension. Already in lowercase when we prepared the temp file above.
-        extension = new_file_path.split(".").pop()
-
-        # Response text
-        response_text = ''
-        # Switch between parsing functions depending on extension.
-        if extension == 'docx':
-            response_text = _parse_word(new_file_path, internal_config)
-        elif extension == 'pptx':
-            response_text = _parse_powerpoint(new_file_path, internal_config)
-        elif extension == 'xlsx':
-            response_text = _parse_excel(new_file_path, internal_config)
-        elif extension in ['odt', 'odp', 'ods']:
-            response_text = _parse_open_office(new_file_path, internal_config)
-        elif extension == 'pdf':
-            response_text = _parse_pdf(new_file_path, internal_config)
-        else:
-            raise ExtensionUnsupported(extension)
+            # File extension in lowercase
+            extension = os.path.splitext(file)[1][1:].lower()
+            if preserve_temp_files:
+                # Create temp file subdirectory if it does not exist
+                make_temp_files_directory(temp_files_location)
+                # temp file name
+                new_file_path = get_new_file_name(temp_files_location, extension)
+                # Copy the file into a temp location with the temp name, so it is preserved along with its content files
+                copy_file(file, new_file_path)
+            else:
+                # The parsers only read the file, so it is parsed right where it is
+                new_file_path = file
 
-        # Check if we need to preserve unzipped content files or delete them.
-        if not get_preserve_temp_files(internal_config):
-            # Delete decompress sublocation
-            shutil.rmtree(get_temp_files_location(internal_config))
+        # Pick the parsing function depending on extension.
+        parse_function = _PARSER_BY_EXTENSION.get(extension)
+        if parse_function is None:
+            raise ExtensionUnsupported(extension)
+        response_text = parse_function(new_file_path, internal_config)
 
+        # Nothing is written in the temp files location unless the temp files are preserved, so there is nothing to delete.
         return response_text
     # Handle custom exceptions by printing its errors if requested to do so in config.
     except (ExtensionUnsupported, FileCorrupted, FileDoesNotExist,
-            ImproperBuffers) as e:
-        if get_output_error_to_console(internal_config):
+            ImproperBuffers, ImproperArguments) as e:
+        if output_error_to_console:
             print(ERROR_HEADER + e.message)
         raise e
 
 
+def _parse_office_in_worker(file: Union[str, bytes], config: Optional[OfficeParserConfig]) -> str:
+    """
+    Parse an office file inside a worker process of parse_office_batch.
+
+    The names of temp files are only unique within a process, so every worker process gets a temp files location of
+    its own to keep the files it preserves from overwriting the ones preserved by the other workers.
+
+    Args:
+        file (Union[str, bytes]): The file path or buffer of the office file.
+        config (OfficeParserConfig, optional): Configuration options.
+
+    Returns:
+        str: The parsed text content.
+    """
+    worker_config = config.copy() if config else {}
+    worker_config['temp_files_location'] = os.path.join(worker_config.get('temp_files_location') or '.',
+                                                        f"{default_temp_files_location}_worker_{os.getpid()}")
+    return parse_office(file, worker_config)
+
+
+def parse_office_batch(files: List[Union[str, bytes]], config: OfficeParserConfig = None, max_workers: Optional[int] = None) -> List[str]:
+    """
+    Parse the content of multiple office files alongside each other in a pool of processes and return their text content.
+
+    Args:
+        files (List[Union[str, bytes]]): The file paths or buffers of the office files.
+        config (OfficeParserConfig, optional): Configuration options used for every file. Defaults to {}.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        List[str]: The parsed text content of each file, in the order of the files.
+
+    Raises:
+        ExtensionUnsupported: If the extension of any file is not supported.
+        FileCorrupted: If any file is corrupted.
+        FileDoesNotExist: If any file does not exist.
+        ImproperBuffers: If the buffers of any file are not proper.
+        ImproperArguments: If the pdf backend in the config is not a known one.
+    """
+    files = list(files)
+    if not files:
+        return []
+
+    # Never start more processes than there are files
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+    # Send the files to the workers in chunks to spend less time in passing them between processes
+    chunksize = max(1, len(files) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_office_in_worker, files, itertools.repeat(config), chunksize=chunksize))
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Usage: officeparser.py <argfilepath>")
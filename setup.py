@@ -27,8 +27,13 @@ setup(
     install_requires=[
         'typing-extensions',
         'filetype',
-        'pdfminer.six'
+        'pdfminer.six',
+        'lxml>=6.1'
     ],
+    extras_require={
+        'pymupdf': ['pymupdf'],
+        'pypdfium2': ['pypdfium2'],
+    },
     entry_points={
         'console_scripts': [
             'officeparser = officeparser:main',
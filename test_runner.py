@@ -23,7 +23,10 @@ Supported Extensions:
 """
 
 import sys
-from officeparserpy.officeparserpy import ERROR_HEADER, ExtensionUnsupported, FileCorrupted, FileDoesNotExist, ImproperBuffers, get_output_error_to_console, parse_office, OfficeParserConfig
+import importlib.util
+from typing import Dict, List, Optional
+from unittest import mock
+from officeparserpy.officeparserpy import ERROR_HEADER, ExtensionUnsupported, FileCorrupted, FileDoesNotExist, ImproperArguments, ImproperBuffers, get_output_error_to_console, parse_office, parse_office_batch, read_bytes_from_file, OfficeParserConfig
 from supported_extensions import supported_extensions
 
 # List of all supported extensions with office Parser
@@ -58,81 +61,246 @@ supportedExtensionTests = [
     },
 ]
 
+# List of additional test files for cases that the main test file of their extension does not cover
+additionalFileTests = [
+    {
+        'name': 'test_rich_text',
+        'ext': 'xlsx'
+    },
+    {
+        'name': 'test_comments',
+        'ext': 'odt'
+    },
+    {
+        'name': 'test_strict',
+        'ext': 'xlsx'
+    },
+    {
+        'name': 'test_external_entity',
+        'ext': 'docx'
+    },
+    {
+        'name': 'test_external_entity',
+        'ext': 'odt'
+    },
+]
+
 # Config file for performing tests
 config: OfficeParserConfig = {
     'preserve_temp_files': True,
     'output_error_to_console': True,
 }
+# Whether the errors are printed, looked up once for all the tests
+output_error_to_console = get_output_error_to_console(config)
+
+# Phrase of the test pdf file that is found in its text whichever way the file is parsed
+pdf_test_phrase = 'Hello World Walkthrough'
+
+# Configs that every test file is parsed with, both from its path and from its buffer.
+# None of them changes the parsed text, so the same content file is expected for all of them.
+test_configs: Dict[str, OfficeParserConfig] = {
+    'preserving temp files': config,
+    'without temp files': {
+        'output_error_to_console': True,
+    },
+    'with cached decompressed files': {
+        'output_error_to_console': True,
+        'cache_decompressed_files': True,
+        'pdf_max_workers': 2,
+    },
+}
 
 # Local list of supported extensions in the test file
 local_supported_extensions_list = [test['ext'] for test in supportedExtensionTests]
 
-def get_filename(ext, is_content_file=False):
+def get_filename(ext, is_content_file=False, name='test'):
     """
     Generate the filename for a given extension.
 
     Args:
         ext (str): The file extension.
         is_content_file (bool): If True, generates the filename for the content file.
+        name (str): The name of the test file without its extension.
 
     Returns:
         str: The generated filename.
     """
-    return f"test/files/test.{ext}" + (".txt" if is_content_file else "")
+    return f"test/files/{name}.{ext}" + (".txt" if is_content_file else "")
 
-def run_test(ext):
+def get_expected_text(ext, name='test'):
+    """
+    Read the expected text of a test file from its content file.
+
+    Args:
+        ext (str): The file extension.
+        name (str): The name of the test file without its extension.
+
+    Returns:
+        str: The expected text.
+    """
+    with open(get_filename(ext, True, name), 'r', encoding='utf-8') as file:
+        return file.read()
+
+def run_test(ext, name='test'):
     """
     Run a test for a given extension.
+    The test file is parsed from its path and from its buffer with each of the test configs.
 
     Args:
         ext (str): The file extension.
+        name (str): The name of the test file without its extension.
     """
-    try:
-        text = parse_office(get_filename(ext), config)
-        expected_text = ''
-        with open(get_filename(ext, True), 'r', encoding='utf-8') as file:
-            expected_text = file.read()
+    test_name = ext if name == 'test' else f"{name}.{ext}"
+    expected_text = get_expected_text(ext, name)
+    file_path = get_filename(ext, name=name)
+    failed_runs = []
+    for config_name, test_config in test_configs.items():
+        for source_name, source in (('path', file_path), ('buffer', read_bytes_from_file(file_path))):
+            try:
+                text = parse_office(source, test_config)
+            except (ExtensionUnsupported, FileCorrupted, FileDoesNotExist,
+                    ImproperBuffers, ImproperArguments) as e:
+                if output_error_to_console:
+                    print(ERROR_HEADER + e.message)
+                text = None
 
-        if text == expected_text:
-            print(f"[{ext}]=> Passed")
-        else:
-            print(f"[{ext}]=> Failed")
+            if text != expected_text:
+                failed_runs.append(f"{source_name} {config_name}")
+
+    if not failed_runs:
+        print(f"[{test_name}]=> Passed")
+    else:
+        print(f"[{test_name}]=> Failed ({', '.join(failed_runs)})")
+
+def run_batch_test(tests):
+    """
+    Run a test parsing all the given test files together in a batch.
+
+    Args:
+        tests (list): The extension and the name of each test file.
+    """
+    file_paths = [get_filename(ext, name=name) for ext, name in tests]
+    try:
+        texts = parse_office_batch(file_paths, {'output_error_to_console': True}, max_workers=2)
     except (ExtensionUnsupported, FileCorrupted, FileDoesNotExist,
-            ImproperBuffers) as e:
-        if get_output_error_to_console(config):
+            ImproperBuffers, ImproperArguments) as e:
+        if output_error_to_console:
             print(ERROR_HEADER + e.message)
+        texts = None
+
+    if texts == [get_expected_text(ext, name) for ext, name in tests]:
+        print("[batch]=> Passed")
+    else:
+        print("[batch]=> Failed")
+
+def parse_pdf_test_file(pdf_config):
+    """
+    Parse the test pdf file from its path and from its buffer with a config.
+
+    Args:
+        pdf_config (OfficeParserConfig): The config to parse the test pdf file with.
+
+    Returns:
+        list: The text parsed from the path and from the buffer, or None in place of a text that could not be parsed.
+    """
+    file_path = get_filename('pdf')
+    texts: List[Optional[str]] = []
+    for source in (file_path, read_bytes_from_file(file_path)):
+        try:
+            texts.append(parse_office(source, pdf_config))
+        except (ExtensionUnsupported, FileCorrupted, FileDoesNotExist,
+                ImproperBuffers, ImproperArguments) as e:
+            if output_error_to_console:
+                print(ERROR_HEADER + e.message)
+            texts.append(None)
+    return texts
+
+def print_test_result(test_name, passed):
+    """
+    Print the result of a test.
+
+    Args:
+        test_name (str): The name of the test.
+        passed (bool): If True, the test passed.
+    """
+    print(f"[{test_name}]=> {'Passed' if passed else 'Failed'}")
+
+def run_pdf_backend_tests():
+    """
+    Run tests for the pdf backends other than pdfminer.six.
+    Their text is laid out differently from the content file, so it is only checked for a known phrase of the test file.
+    """
+    for pdf_backend in ('pymupdf', 'pypdfium2'):
+        texts = parse_pdf_test_file({'pdf_backend': pdf_backend, 'output_error_to_console': True})
+        print_test_result(f"pdf {pdf_backend}", all(text and pdf_test_phrase in text for text in texts))
+
+    # A backend whose library is not installed falls back to pdfminer.six, which gives the text of the content file
+    with mock.patch.object(importlib.util, 'find_spec', return_value=None):
+        texts = parse_pdf_test_file({'pdf_backend': 'pymupdf', 'output_error_to_console': True})
+    expected_text = get_expected_text('pdf')
+    print_test_result("pdf backend fallback", all(text == expected_text for text in texts))
+
+    # An unknown backend is an error
+    try:
+        parse_office(get_filename('pdf'), {'pdf_backend': 'bogus'})
+        print_test_result("pdf unknown backend", False)
+    except ImproperArguments:
+        print_test_result("pdf unknown backend", True)
+
+def run_pdf_fast_mode_tests():
+    """
+    Run tests for the pdf fast mode in a single process and with the pages split across processes.
+    Its text is not laid out like the content file, so it is checked for a known phrase of the test file,
+    and both ways of parsing are expected to give the same text.
+    """
+    texts = parse_pdf_test_file({'pdf_fast_mode': True, 'output_error_to_console': True})
+    texts_in_processes = parse_pdf_test_file({'pdf_fast_mode': True, 'pdf_max_workers': 2, 'output_error_to_console': True})
+    print_test_result("pdf fast mode", all(text and pdf_test_phrase in text for text in texts))
+    print_test_result("pdf fast mode in processes", texts_in_processes == texts and None not in texts)
 
 def run_all_tests():
     """Run all available tests."""
+    available_tests = []
     for test in supportedExtensionTests:
         if test['testAvailable']:
             run_test(test['ext'])
+            available_tests.append((test['ext'], 'test'))
         else:
             print(f"[{test['ext']}]=> Skipped")
 
-if len(sys.argv) != 1 and len(sys.argv) != 2:
-    print("Usage: test_runner.py")
-    print("Usage: test_runner.py <extension>")
-    sys.exit(1)
+    for test in additionalFileTests:
+        run_test(test['ext'], test['name'])
+        available_tests.append((test['ext'], test['name']))
 
-# Run all test files with test content if no argument passed.
-if len(sys.argv) == 1:
-    # Test to check all items in the local extension list are present in supportedExtensions.py file
-    if all(ext in supported_extensions for ext in local_supported_extensions_list):
-        print('All extensions in test files found in the primary supportedExtensions.py file')
-    else:
-        print('Extension in test files missing from the primary supportedExtensions.py file')
+    run_batch_test(available_tests)
+    run_pdf_backend_tests()
+    run_pdf_fast_mode_tests()
 
-    # Test to check all items in supportedExtensions.py file are present in the local extension list
-    if all(ext in local_supported_extensions_list for ext in supported_extensions):
-        print('All extensions in the primary supportedExtensions.py file found in the test file')
-    else:
-        print('Extension in the primary supportedExtensions.py file missing from the test file')
+# Parsing in batches starts worker processes which may import this module again, so the tests only run as a script.
+if __name__ == '__main__':
+    if len(sys.argv) != 1 and len(sys.argv) != 2:
+        print("Usage: test_runner.py")
+        print("Usage: test_runner.py <extension>")
+        sys.exit(1)
 
-    run_all_tests()
-elif len(sys.argv) == 2:
-    if sys.argv[1] in local_supported_extensions_list:
-        text = parse_office(get_filename(sys.argv[1]), config)
-        print(text)
-    else:
-        print('The requested extension test is not currently available.')
+    # Run all test files with test content if no argument passed.
+    if len(sys.argv) == 1:
+        # Test to check all items in the local extension list are present in supportedExtensions.py file
+        if all(ext in supported_extensions for ext in local_supported_extensions_list):
+            print('All extensions in test files found in the primary supportedExtensions.py file')
+        else:
+            print('Extension in test files missing from the primary supportedExtensions.py file')
+
+        # Test to check all items in supportedExtensions.py file are present in the local extension list
+        if all(ext in local_supported_extensions_list for ext in supported_extensions):
+            print('All extensions in the primary supportedExtensions.py file found in the test file')
+        else:
+            print('Extension in the primary supportedExtensions.py file missing from the test file')
+
+        run_all_tests()
+    elif len(sys.argv) == 2:
+        if sys.argv[1] in local_supported_extensions_list:
+            text = parse_office(get_filename(sys.argv[1]), config)
+            print(text)
+        else:
+            print('The requested extension test is not currently available.')